@@ -6,77 +6,110 @@ This simulates the interface without actually running curses.
 
 import sys
 sys.path.insert(0, '/Users/bill')
-from dircomp import DirectoryComparer
-from datetime import datetime
+from dircomp import DirectoryComparer, _STATUS_DESCRIPTIONS
+from typing import Optional
 
-def format_size(size: int) -> str:
-    """Format file size in human readable format."""
-    for unit in ['B', 'K', 'M', 'G', 'T']:
-        if size < 1024:
-            return f"{size:3.0f}{unit}"
-        size /= 1024
-    return f"{size:.1f}P"
+# Rendering here is bound by string building and stdout writes, not numeric
+# work, so a JIT such as numba has nothing to accelerate. Optimizations in
+# this module stick to batching output; sizes, times and status labels come
+# from dircomp's cached formatters, and any byte-crunching (content
+# comparison) lives there too.
+
+_MISSING = "─ MISSING ─"
+
+# Simulated terminal layout (80 columns, fixed column widths)
+_WIDTH = 80
+_LEFT_WIDTH = 25  # Fixed width for left column
+_STATUS_WIDTH = 10  # Fixed width for status column
+_RIGHT_WIDTH = _WIDTH - _LEFT_WIDTH - _STATUS_WIDTH - 4  # Remaining width for right column
+
+_BAR_EQ = "=" * _WIDTH
+_BAR_DASH = "-" * _WIDTH
+_HINTS = "↑↓:Select F3/<:Copy→Left F4/>:Copy→Right E:Edit M:Merge R:Refresh H:Help Q:Quit"
+_ASCII_HINTS = "^v:Select F3/<:Copy Left F4/>:Copy Right E:Edit M:Merge R:Refresh H:Help Q:Quit"
+
+# Box-drawing characters only fail on non-UTF terminals, so decide once
+_CAN_BOX = (getattr(sys.stdout, 'encoding', None) or '').lower().startswith('utf')
+
+# Header lines, bottom line, column separator, missing-file marker and key
+# hints for each border style
+_BORDERS = {
+    "box": (
+        "┌" + "─" * _LEFT_WIDTH + "┬" + "─" * _STATUS_WIDTH + "┬" + "─" * _RIGHT_WIDTH + "┐",
+        f"│{'LEFT DIRECTORY'.ljust(_LEFT_WIDTH)}│{'STATUS'.ljust(_STATUS_WIDTH)}│{'RIGHT DIRECTORY'.ljust(_RIGHT_WIDTH)}│",
+        "├" + "─" * _LEFT_WIDTH + "┼" + "─" * _STATUS_WIDTH + "┼" + "─" * _RIGHT_WIDTH + "┤",
+        "└" + "─" * _LEFT_WIDTH + "┴" + "─" * _STATUS_WIDTH + "┴" + "─" * _RIGHT_WIDTH + "┘",
+        "│",
+        _MISSING,
+        _HINTS,
+    ),
+    "simple": (
+        _BAR_DASH,
+        f"{'LEFT'.ljust(_WIDTH // 3)}{'STATUS'.ljust(10)}RIGHT",
+        _BAR_DASH,
+        _BAR_DASH,
+        "|",
+        "- MISSING -",
+        _ASCII_HINTS,
+    ),
+}
+
+def demo_interface(style: Optional[str] = None):
+    """Show what the interface looks like.
+    
+    style is "box" for box-drawing borders or "simple" for plain ASCII;
+    by default it is picked from the stdout encoding.
+    """
+    if style is None:
+        style = "box" if _CAN_BOX else "simple"
 
-def demo_interface():
-    """Show what the interface looks like."""
     comparer = DirectoryComparer('t1', 't2')
-    comparer.scan_directories()
     
-    width = 80  # Simulate 80-character terminal width
+    width = _WIDTH
+    left_width = _LEFT_WIDTH
+    status_width = _STATUS_WIDTH
+    right_width = _RIGHT_WIDTH
+    out = []  # Collect every line and write once at the end
     
     # Header
-    print("=" * width)
+    out.append(_BAR_EQ)
     header = f" Directory Comparison: {comparer.left_dir.name} <-> {comparer.right_dir.name} "
-    print(header.ljust(width))
-    print("=" * width)
+    out.append(header.ljust(width))
+    out.append(_BAR_EQ)
     
     # Draw detailed column headers with clear sections
-    # Calculate proper column widths - make them exactly match the content positioning
-    left_width = 25  # Fixed width for left column
-    status_width = 10  # Fixed width for status column  
-    right_width = width - left_width - status_width - 4  # Remaining width for right column
+    headers_line1, headers_line2, headers_line3, bottom_line, sep, missing, hints = _BORDERS[style]
     
-    headers_line1 = "┌" + "─" * left_width + "┬" + "─" * status_width + "┬" + "─" * right_width + "┐"
-    headers_line2 = f"│{'LEFT DIRECTORY':<{left_width}}│{'STATUS':<{status_width}}│{'RIGHT DIRECTORY':<{right_width}}│"
-    headers_line3 = "├" + "─" * left_width + "┼" + "─" * status_width + "┼" + "─" * right_width + "┤"
+    out.append(headers_line1[:width])
+    out.append(headers_line2[:width])
+    out.append(headers_line3[:width])
     
-    try:
-        print(headers_line1[:width])
-        print(headers_line2[:width]) 
-        print(headers_line3[:width])
-    except:
-        # Fallback to simple headers if box drawing fails
-        print("-" * width)
-        headers = f"{'LEFT':<{width//3}}{'STATUS':<10}{'RIGHT'}"
-        print(headers[:width])
-        print("-" * width)
+    # Bind the status table to a local to avoid a global lookup per row
+    _desc = _STATUS_DESCRIPTIONS
     
-    # File listing - one file per line with all information
-    for i, result in enumerate(comparer.results):
+    # Filename space left after the size/time info (and ">> " when selected)
+    sel_max = left_width - 21
+    sel_tail = left_width - 24
+    norm_max = left_width - 18
+    norm_tail = left_width - 21
+    
+    def _render_row(result, selected: bool) -> str:
+        """Format one result as a bordered line of the listing."""
+        lf = result.left_file
+        rf = result.right_file
+        
         # Format file information for left side
-        left_info = "─ MISSING ─"
-        if result.left_file and result.left_file.exists:
-            size_str = format_size(result.left_file.size)
-            time_str = datetime.fromtimestamp(result.left_file.mtime).strftime("%m/%d %H:%M")
-            left_info = f"{size_str} {time_str}"
+        left_info = missing
+        if lf and lf.exists:
+            left_info = f"{lf.size_str} {lf.mtime_str}"
         
         # Format file information for right side  
-        right_info = "─ MISSING ─"
-        if result.right_file and result.right_file.exists:
-            size_str = format_size(result.right_file.size)
-            time_str = datetime.fromtimestamp(result.right_file.mtime).strftime("%m/%d %H:%M")
-            right_info = f"{size_str} {time_str}"
+        right_info = missing
+        if rf and rf.exists:
+            right_info = f"{rf.size_str} {rf.mtime_str}"
         
         # Get status description
-        status_descriptions = {
-            "ONLY_RIGHT": "<<<",
-            "ONLY_LEFT": ">>>", 
-            "DIFFERENT_SIZE": "SIZE",
-            "DIFFERENT_TIME": "TIME",
-            "DIFFERENT_CONTENT": "DIFF",
-            "IDENTICAL": "SAME"
-        }
-        status_text = status_descriptions.get(result.status, "????")
+        status_text = _desc.get(result.status, "????")
         
         # Add merge indicator
         if result.can_merge:
@@ -86,38 +119,45 @@ def demo_interface():
         # Create the complete line with filename and status info
         filename = result.relative_path
         
-        # Show selection indicator by adjusting filename formatting for first line
-        if i == 0:
+        # Show selection indicator by adjusting filename formatting
+        if selected:
             # For selected line, add >> indicator and adjust space accordingly
-            if len(filename) > left_width - 21:  # Reserve space for >> + size/time info
-                filename = "..." + filename[-(left_width - 24):]
-            left_part = f">> {filename:<{left_width-21}}{left_info:>17}"
+            if len(filename) > sel_max:  # Reserve space for >> + size/time info
+                filename = "..." + filename[-sel_tail:]
+            left_part = f">> {filename.ljust(sel_max)}{left_info.rjust(17)}"
         else:
             # For non-selected lines, normal formatting
-            if len(filename) > left_width - 18:  # Reserve space for size/time info
-                filename = "..." + filename[-(left_width - 21):]
-            left_part = f"{filename:<{left_width-18}}{left_info:>17}"
-        
-        # Ensure exact column widths - pad or truncate as needed
-        left_part = f"{left_part:<{left_width}}"[:left_width]
-        status_part = f"{status_text:^{status_width}}"
-        right_part = f"{right_info:<{right_width}}"[:right_width]
+            if len(filename) > norm_max:  # Reserve space for size/time info
+                filename = "..." + filename[-norm_tail:]
+            left_part = f"{filename.ljust(norm_max)}{left_info.rjust(17)}"
         
-        # Construct the complete line with borders
-        line = f"│{left_part}│{status_part}│{right_part}│"
-        
-        print(line[:width])
+        # Construct the complete line with borders in a single f-string,
+        # padding or truncating each column to its exact width
+        return (f"{sep}{left_part.ljust(left_width)[:left_width]}"
+                f"{sep}{status_text.center(status_width)}"
+                f"{sep}{right_info.ljust(right_width)[:right_width]}{sep}"[:width])
+    
+    # File listing - one file per line with all information, rendered as
+    # results are produced rather than after the whole scan is stored.
+    # The first row is the selected one, so peel it off the loop.
+    results = comparer.iter_results()
+    total = 0
+    first = next(results, None)
+    if first is not None:
+        out.append(_render_row(first, True))
+        total = 1
+        for result in results:
+            out.append(_render_row(result, False))
+            total += 1
     
     # Bottom border
-    try:
-        bottom_line = "└" + "─" * left_width + "┴" + "─" * status_width + "┴" + "─" * right_width + "┘"
-        print(bottom_line)
-    except:
-        print("-" * width)
+    out.append(bottom_line)
+    
+    out.append(f"Files: {total} | Selected: 1/{total}")
+    out.append(hints)
+    out.append(_BAR_EQ)
     
-    print(f"Files: {len(comparer.results)} | Selected: 1/{len(comparer.results)}")
-    print("↑↓:Select F3/<:Copy→Left F4/>:Copy→Right E:Edit M:Merge R:Refresh H:Help Q:Quit")
-    print("=" * width)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     demo_interface()
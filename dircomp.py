@@ -8,34 +8,311 @@ import os
 import sys
 import curses
 import hashlib
+import shlex
 import shutil
 import threading
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Set
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterator, List, Tuple, Optional, Union
 import argparse
 
 
+# Short symbols for each comparison status
+_SYMBOLS = {
+    "ONLY_RIGHT": "<<<",
+    "ONLY_LEFT": ">>>",
+    "DIFFERENT_SIZE": "!=",
+    "DIFFERENT_TIME": "~=",
+    "DIFFERENT_CONTENT": "<>",
+    "IDENTICAL": "==",
+    "PENDING": "=?"
+}
+
+# Status column labels in the file list
+_STATUS_DESCRIPTIONS = {
+    "ONLY_RIGHT": "<<<",
+    "ONLY_LEFT": ">>>",
+    "DIFFERENT_SIZE": "SIZE",
+    "DIFFERENT_TIME": "TIME",
+    "DIFFERENT_CONTENT": "DIFF",
+    "IDENTICAL": "SAME",
+    "PENDING": "SAME?"
+}
+
+# One-byte status codes mirrored in DirectoryComparer.status_arr, so
+# "find the next difference" is a C-level bytearray scan
+_STATUS_CODES = {
+    "ONLY_RIGHT": ord('R'),
+    "ONLY_LEFT": ord('L'),
+    "DIFFERENT_SIZE": ord('!'),
+    "DIFFERENT_TIME": ord('~'),
+    "DIFFERENT_CONTENT": ord('<'),
+    "IDENTICAL": ord('='),
+    "PENDING": ord('?')
+}
+# Codes of rows that differ, or may differ once their content is compared
+_DIFFERENT_CODES = b"RL!~<?"
+
+# Size thresholds for human readable sizes, largest first
+_SIZE_UNITS = ((1 << 40, 'T'), (1 << 30, 'G'), (1 << 20, 'M'), (1 << 10, 'K'))
+
+# Read size used when hashing file content
+HASH_CHUNK_SIZE = 1 << 20
+
+# Buffer size for the user-space copy fallback
+COPY_CHUNK_SIZE = 1 << 20
+
+# Bytes that do not count as text: everything outside printable ASCII
+# except tab, newline and carriage return
+_NON_TEXT_BYTES = bytes(b for b in range(256) if not (32 <= b < 127 or b in (9, 10, 13)))
+
+
+# Read size used when comparing two files' contents byte by byte
+COMPARE_CHUNK_SIZE = 1 << 16
+
+# Below this many content checks a worker pool costs more than it saves
+PARALLEL_COMPARE_MIN = 32
+
+# Number of leading bytes sampled to decide whether a file is text
+SNIFF_SIZE = 512
+
+
+def _sniff(path) -> bytes:
+    """Read the first SNIFF_SIZE bytes of a file without a buffered file object."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, SNIFF_SIZE)
+    finally:
+        os.close(fd)
+
+
+def _files_equal(left, right) -> bool:
+    """Compare two equal-sized files' contents, stopping at the first mismatch.
+    
+    Plain reads rather than mmap: comparing two bytes chunks is already a memcmp.
+    """
+    with open(left, 'rb', buffering=0) as f1, open(right, 'rb', buffering=0) as f2:
+        while True:
+            chunk = f1.read(COMPARE_CHUNK_SIZE)
+            if chunk != f2.read(COMPARE_CHUNK_SIZE):
+                return False
+            if not chunk:
+                return True
+
+
+def _copy_file_range(infd: int, outfd: int) -> int:
+    """Copy with copy_file_range(2); CoW filesystems (btrfs, XFS) can share extents.
+    
+    Returns the number of bytes copied.
+    """
+    total = 0
+    # Up to 1 GiB per call; loop until the kernel reports EOF
+    while True:
+        copied = os.copy_file_range(infd, outfd, 1 << 30)
+        if not copied:
+            return total
+        total += copied
+
+
+def _sendfile(infd: int, outfd: int) -> int:
+    """Copy with sendfile(2), which takes any output file on Linux >= 2.6.33.
+    
+    Returns the number of bytes copied.
+    """
+    offset = 0
+    while True:
+        sent = os.sendfile(outfd, infd, offset, 1 << 30)
+        if not sent:
+            return offset
+        offset += sent
+
+
+# In-kernel copy strategies, tried in order; copy_file_range fails across
+# filesystems on older kernels where sendfile still works
+_KERNEL_COPIES = tuple(
+    copy for copy, available in (
+        (_copy_file_range, hasattr(os, 'copy_file_range')),
+        (_sendfile, hasattr(os, 'sendfile') and sys.platform.startswith('linux')),
+    ) if available
+)
+
+
+def _fast_copy(src, dst) -> None:
+    """Copy file content and metadata like shutil.copy2, in-kernel where possible.
+    
+    The data stays out of user space unless every strategy in
+    _KERNEL_COPIES fails, in which case a plain buffered copy is used.
+    """
+    # Opening dst for writing truncates it, which would wipe src when both
+    # name the same file (hardlinked trees, a directory compared with itself)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                if kernel_copy(fsrc.fileno(), fdst.fileno()) or not size:
+                    break
+            except OSError:
+                pass
+            # Unsupported here, or nothing was copied from a non-empty file
+            # (some filesystems report EOF at once); start over with the
+            # next strategy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        else:
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+    shutil.copystat(src, dst)
+
+
+def _walk(root: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file under root, depth first.
+    
+    os.scandir hands back each entry's type from the directory listing, so
+    the type checks cost no syscalls; the caller's DirEntry.stat() is still
+    one stat() per file (only Windows caches it in the listing). Unreadable
+    directories, including a missing root, are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+@lru_cache(maxsize=4096)
+def _format_mtime(minute: int) -> str:
+    """Format a timestamp truncated to the minute; siblings often share one."""
+    return datetime.fromtimestamp(minute).strftime("%m/%d %H:%M")
+
+
+@lru_cache(maxsize=8192)
+def _format_size(size: int) -> str:
+    """Format file size in human readable format (memoized; copies share sizes)."""
+    if size >= 1 << 50:
+        return f"{size / (1 << 50):.1f}P"
+    # Compare against unit thresholds instead of repeatedly dividing
+    for limit, unit in _SIZE_UNITS:
+        if size >= limit:
+            return f"{size / limit:3.0f}{unit}"
+    return f"{size:3.0f}B"
+
+
+def _is_text(data: bytes) -> bool:
+    """Simple heuristic: if most bytes are printable, consider it text."""
+    if not data:
+        return True
+    # translate() drops the non-text bytes in C, leaving only text chars.
+    # That already runs at native speed on a SNIFF_SIZE sample, so a numba
+    # kernel would only add JIT start-up and a numpy dependency.
+    text_chars = len(data.translate(None, _NON_TEXT_BYTES))
+    return text_chars / len(data) > 0.7
+
+
 class FileInfo:
     """Information about a file for comparison."""
     
-    def __init__(self, path: Path, relative_path: str):
-        self.path = path
+    __slots__ = ('_fspath', '_path', 'relative_path', '_stat', '_hash', '_mtime_str', '_size_str')
+    
+    def __init__(self, path: Union[str, Path], relative_path: str,
+                 st: Optional[os.stat_result] = None):
+        # The scan passes plain strings; building a Path per file costs more
+        # than the directory walk itself, so one is only made on request
+        self._fspath = os.fspath(path)
+        self._path = path if isinstance(path, Path) else None
         self.relative_path = relative_path
-        self.size = path.stat().st_size if path.exists() else 0
-        self.mtime = path.stat().st_mtime if path.exists() else 0
-        self.exists = path.exists()
+        if st is None:
+            # One stat() call instead of separate exists/size/mtime lookups
+            try:
+                st = os.stat(self._fspath)
+            except OSError:
+                st = None
+        # Kept whole so size, mtime and mode never need another stat()
+        self._stat = st
         self._hash = None
+        self._mtime_str = None
+        self._size_str = None
+    
+    @property
+    def path(self) -> Path:
+        """Full path to the file (Path built lazily)."""
+        if self._path is None:
+            self._path = Path(self._fspath)
+        return self._path
+    
+    @property
+    def exists(self) -> bool:
+        """Whether the file existed when it was scanned."""
+        return self._stat is not None
+    
+    @property
+    def size(self) -> int:
+        """File size in bytes (0 if missing)."""
+        return self._stat.st_size if self._stat is not None else 0
+    
+    @property
+    def mtime(self) -> float:
+        """Modification time as a timestamp (0 if missing)."""
+        return self._stat.st_mtime if self._stat is not None else 0
+    
+    @property
+    def mode(self) -> int:
+        """st_mode bits (0 if missing)."""
+        return self._stat.st_mode if self._stat is not None else 0
+    
+    @property
+    def mtime_str(self) -> str:
+        """Modification time formatted for display (cached)."""
+        if self._mtime_str is None:
+            self._mtime_str = _format_mtime(int(self.mtime) // 60 * 60)
+        return self._mtime_str
+    
+    @property
+    def size_str(self) -> str:
+        """File size formatted for display (cached)."""
+        if self._size_str is None:
+            self._size_str = _format_size(self.size)
+        return self._size_str
     
     @property
     def hash(self) -> str:
-        """Calculate MD5 hash of file content (lazy loading)."""
+        """Calculate SHA-256 hash of file content (lazy loading).
+        
+        The digest is only a content fingerprint for comparison, not a
+        security primitive; SHA-256 is used because OpenSSL accelerates it
+        with SHA-NI / ARMv8 crypto instructions where available.
+        """
         if self._hash is None and self.exists:
             try:
-                with open(self.path, 'rb') as f:
-                    self._hash = hashlib.md5(f.read()).hexdigest()
+                # Stream the file through a reusable buffer so memory use
+                # stays constant regardless of file size
+                h = hashlib.sha256()
+                buf = bytearray(HASH_CHUNK_SIZE)
+                mv = memoryview(buf)
+                with open(self._fspath, 'rb', buffering=0) as f:
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        h.update(mv[:n])
+                self._hash = h.hexdigest()
             except (OSError, IOError):
                 self._hash = ""
         return self._hash or ""
@@ -44,42 +321,94 @@ class FileInfo:
 class ComparisonResult:
     """Result of comparing two files."""
     
+    __slots__ = ('left_file', 'right_file', 'relative_path',
+                 '_status', '_can_merge', '_rendered', '_rendered_key')
+    
+    # When False, equal size and mtime are trusted as identical (like rsync).
+    # Set per class, not per row; see _ChecksumResult
+    hash_equal_sizes = False
+    
     def __init__(self, left_file: Optional[FileInfo], right_file: Optional[FileInfo]):
         self.left_file = left_file
         self.right_file = right_file
         self.relative_path = (left_file or right_file).relative_path
-        
+        self._status = None
+        self._can_merge = None
+        self._rendered = None  # File list line cached by CursesUI
+        self._rendered_key = None
+    
+    def invalidate(self) -> None:
+        """Drop cached comparison data after either file has changed."""
+        self._status = None
+        self._can_merge = None
+        self._rendered = None
+        self._rendered_key = None
+    
     @property
     def status(self) -> str:
-        """Get comparison status."""
+        """Get comparison status (computed once, then cached)."""
+        if self._status is None:
+            status = self._quick_status()
+            if status == "PENDING":
+                status = self._compare_content()
+            self._status = status
+        return self._status
+    
+    @property
+    def display_status(self) -> str:
+        """Status for display, without reading file content.
+        
+        "PENDING" marks a pair whose size and time match but whose content
+        has not been compared yet (see DirectoryComparer.ensure_compared).
+        """
+        if self._status is None:
+            status = self._quick_status()
+            if status == "PENDING":
+                return status
+            self._status = status
+        return self._status
+    
+    def _quick_status(self) -> str:
+        """Classify the pair from its stat results alone."""
         if not self.left_file or not self.left_file.exists:
             return "ONLY_RIGHT"
         elif not self.right_file or not self.right_file.exists:
             return "ONLY_LEFT"
-        elif self.left_file.size != self.right_file.size:
+        # Read the cached stat results directly in this hot path
+        left_st = self.left_file._stat
+        right_st = self.right_file._stat
+        if left_st.st_size != right_st.st_size:
             return "DIFFERENT_SIZE"
-        elif abs(self.left_file.mtime - self.right_file.mtime) > 1:  # 1 second tolerance
+        elif abs(left_st.st_mtime - right_st.st_mtime) > 1:  # 1 second tolerance
             return "DIFFERENT_TIME"
-        elif self.left_file.hash != self.right_file.hash:
-            return "DIFFERENT_CONTENT"
-        else:
+        elif not self.hash_equal_sizes:
             return "IDENTICAL"
+        return "PENDING"
+    
+    def _compare_content(self) -> str:
+        """Compare the content of two files whose size and time match."""
+        # Sizes already match here; a direct byte comparison stops at the
+        # first difference and skips hashing. FileInfo.hash remains for
+        # callers that want fingerprints
+        try:
+            same = _files_equal(self.left_file._fspath, self.right_file._fspath)
+        except OSError:
+            same = False
+        return "IDENTICAL" if same else "DIFFERENT_CONTENT"
     
     @property
     def symbol(self) -> str:
         """Get symbol for status display."""
-        symbols = {
-            "ONLY_RIGHT": "<<<",
-            "ONLY_LEFT": ">>>",
-            "DIFFERENT_SIZE": "!=",
-            "DIFFERENT_TIME": "~=",
-            "DIFFERENT_CONTENT": "<>",
-            "IDENTICAL": "=="
-        }
-        return symbols.get(self.status, "??")
+        return _SYMBOLS.get(self.status, "??")
     
     @property
     def can_merge(self) -> bool:
+        """Check if files can be merged (computed once, then cached)."""
+        if self._can_merge is None:
+            self._can_merge = self._compute_can_merge()
+        return self._can_merge
+    
+    def _compute_can_merge(self) -> bool:
         """Check if files can be merged (both exist and are text files)."""
         if not (self.left_file and self.left_file.exists and 
                 self.right_file and self.right_file.exists):
@@ -90,59 +419,172 @@ class ComparisonResult:
             
         # Check if files are likely text files
         try:
-            with open(self.left_file.path, 'rb') as f:
-                left_sample = f.read(512)
-            with open(self.right_file.path, 'rb') as f:
-                right_sample = f.read(512)
-            
-            # Simple heuristic: if most bytes are printable, consider it text
-            def is_text(data):
-                if not data:
-                    return True
-                text_chars = sum(1 for b in data if b in range(32, 127) or b in [9, 10, 13])
-                return text_chars / len(data) > 0.7
-            
-            return is_text(left_sample) and is_text(right_sample)
+            return _is_text(_sniff(self.left_file._fspath)) and _is_text(_sniff(self.right_file._fspath))
         except (OSError, IOError):
             return False
 
 
+class _ChecksumResult(ComparisonResult):
+    """Comparison result that compares content when size and time match."""
+    
+    __slots__ = ()
+    
+    hash_equal_sizes = True
+
+
 class DirectoryComparer:
     """Main class for comparing directories."""
     
-    def __init__(self, left_dir: str, right_dir: str):
+    def __init__(self, left_dir: str, right_dir: str, hash_equal_sizes: bool = False):
         self.left_dir = Path(left_dir).resolve()
         self.right_dir = Path(right_dir).resolve()
         self.results: List[ComparisonResult] = []
+        # One _STATUS_CODES byte per result, kept in step with results
+        self.status_arr = bytearray()
         self.selected_index = 0
+        # Compare content of files whose size and mtime match instead of assuming they are identical
+        self.hash_equal_sizes = hash_equal_sizes
+        # EDITOR value and its parsed argv, re-split only when EDITOR changes
+        self._editor_source = None
+        self._editor_argv: List[str] = []
         
+    def editor_command(self) -> List[str]:
+        """Return $EDITOR (default vim) split into an argv, e.g. "code --wait"."""
+        editor = os.environ.get('EDITOR') or 'vim'
+        if editor != self._editor_source:
+            try:
+                argv = shlex.split(editor)
+            except ValueError:
+                argv = []  # Unbalanced quotes
+            # A malformed or blank EDITOR falls back to the default rather
+            # than running the file itself or crashing the UI
+            self._editor_argv = argv or ['vim']
+            self._editor_source = editor
+        return self._editor_argv
+    
     def scan_directories(self) -> None:
-        """Scan both directories and build comparison results."""
-        left_files = self._scan_directory(self.left_dir)
-        right_files = self._scan_directory(self.right_dir)
-        
-        all_relative_paths = set(left_files.keys()) | set(right_files.keys())
-        
-        self.results = []
-        for rel_path in sorted(all_relative_paths):
-            left_file = left_files.get(rel_path)
-            right_file = right_files.get(rel_path)
-            result = ComparisonResult(left_file, right_file)
-            self.results.append(result)
-    
-    def _scan_directory(self, directory: Path) -> Dict[str, FileInfo]:
-        """Scan a directory and return a dict of relative_path -> FileInfo."""
-        files = {}
-        if not directory.exists():
-            return files
-            
-        for file_path in directory.rglob('*'):
-            if file_path.is_file():
-                try:
-                    relative_path = str(file_path.relative_to(directory))
-                    files[relative_path] = FileInfo(file_path, relative_path)
-                except (OSError, ValueError):
+        """Scan both directories and build comparison results.
+        
+        Content checks (hash_equal_sizes) are not run here; they happen when
+        a result's status is read, or in bulk through ensure_compared().
+        """
+        self.results = list(self.iter_results())
+        # Plain Python: a numpy pass would first gather the same stat fields in Python
+        codes = _STATUS_CODES
+        self.status_arr = bytearray(codes[result.display_status] for result in self.results)
+    
+    def ensure_compared(self, start: int, stop: Optional[int] = None) -> None:
+        """Resolve pending content checks for results[start:stop].
+        
+        With stop omitted only the result at start is checked.
+        """
+        if stop is None:
+            stop = start + 1
+        start = max(0, start)
+        results = self.results[start:stop]
+        self._prefetch_content_checks(results)
+        for index, result in enumerate(results, start):
+            self.status_arr[index] = _STATUS_CODES[result.display_status]
+    
+    def find_difference(self, start: int, backward: bool = False) -> int:
+        """Return the index of the nearest differing row after start, or -1.
+        
+        With backward=True the search goes towards the top instead. Rows
+        whose content is still pending are compared on the way.
+        """
+        codes = self.status_arr
+        while True:
+            if backward:
+                index = max(codes.rfind(code, 0, max(start, 0)) for code in _DIFFERENT_CODES)
+            else:
+                hits = [codes.find(code, start + 1) for code in _DIFFERENT_CODES]
+                index = min((hit for hit in hits if hit >= 0), default=-1)
+            if index < 0:
+                return -1
+            if codes[index] == _STATUS_CODES["PENDING"]:
+                self.ensure_compared(index)
+                if codes[index] == _STATUS_CODES["IDENTICAL"]:
+                    start = index
                     continue
+            return index
+    
+    @staticmethod
+    def _prefetch_content_checks(results: List[ComparisonResult]) -> None:
+        """Resolve statuses that still need a content check.
+        
+        File reads release the GIL, so larger batches run concurrently in a
+        thread pool.
+        """
+        pending = [result for result in results if result.display_status == "PENDING"]
+        
+        if len(pending) < PARALLEL_COMPARE_MIN:
+            # Not worth starting a pool for a handful of files
+            for result in pending:
+                result.status
+            return
+        # Content checks are I/O bound, so oversubscribe the cores
+        workers = (os.cpu_count() or 1) * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(DirectoryComparer._compare_one, pending))
+    
+    @staticmethod
+    def _compare_one(result: ComparisonResult) -> ComparisonResult:
+        """Resolve and cache one result's status; safe to run in a worker thread."""
+        result.status
+        return result
+    
+    def iter_results(self) -> Iterator[ComparisonResult]:
+        """Scan both directories and yield comparison results one at a time.
+        
+        Unlike scan_directories(), results are not stored on the comparer.
+        """
+        # The two trees are independent (often on different disks), so walk
+        # them concurrently; scandir releases the GIL during each syscall
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            left_future = executor.submit(self._scan_directory, self.left_dir)
+            right_future = executor.submit(self._scan_directory, self.right_dir)
+            left_files, right_files = left_future.result(), right_future.result()
+        
+        # Both listings are sorted, so a single two-pointer pass pairs up
+        # matching paths without building and sorting their union
+        result_type = _ChecksumResult if self.hash_equal_sizes else ComparisonResult
+        i = j = 0
+        n_left, n_right = len(left_files), len(right_files)
+        while i < n_left and j < n_right:
+            left_rel, left_info = left_files[i]
+            right_rel, right_info = right_files[j]
+            if left_rel == right_rel:
+                yield result_type(left_info, right_info)
+                i += 1
+                j += 1
+            elif left_rel < right_rel:
+                yield result_type(left_info, None)
+                i += 1
+            else:
+                yield result_type(None, right_info)
+                j += 1
+        for _, left_info in left_files[i:]:
+            yield result_type(left_info, None)
+        for _, right_info in right_files[j:]:
+            yield result_type(None, right_info)
+    
+    def _scan_directory(self, directory: Path) -> List[Tuple[str, FileInfo]]:
+        """Scan a directory and return (relative_path, FileInfo) pairs sorted by path."""
+        files = []
+        root = str(directory)
+        # Every entry path starts with root plus a separator, so the relative
+        # path is a plain slice
+        base_len = len(os.path.join(root, ''))
+        for entry in _walk(root):
+            relative_path = entry.path[base_len:]
+            if os.sep != '/':
+                relative_path = relative_path.replace(os.sep, '/')
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append((relative_path, FileInfo(entry.path, relative_path, st=st)))
+        files.sort(key=itemgetter(0))
         return files
     
     def copy_file_left_to_right(self, index: int) -> bool:
@@ -157,10 +599,9 @@ class DirectoryComparer:
         try:
             dest_path = self.right_dir / result.relative_path
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(result.left_file.path, dest_path)
+            _fast_copy(result.left_file._fspath, dest_path)
             
-            # Update the result
-            result.right_file = FileInfo(dest_path, result.relative_path)
+            self._refresh_one(index)
             return True
         except (OSError, IOError):
             return False
@@ -177,14 +618,28 @@ class DirectoryComparer:
         try:
             dest_path = self.left_dir / result.relative_path
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(result.right_file.path, dest_path)
+            _fast_copy(result.right_file._fspath, dest_path)
             
-            # Update the result
-            result.left_file = FileInfo(dest_path, result.relative_path)
+            self._refresh_one(index)
             return True
         except (OSError, IOError):
             return False
     
+    def _refresh_one(self, index: int) -> None:
+        """Re-stat one result's two paths after a copy, edit or merge.
+        
+        Cheaper than scan_directories(), which re-walks both trees to
+        refresh a single row.
+        """
+        result = self.results[index]
+        left_file = FileInfo(self.left_dir / result.relative_path, result.relative_path)
+        right_file = FileInfo(self.right_dir / result.relative_path, result.relative_path)
+        # Match the scan, which leaves a missing side as None
+        result.left_file = left_file if left_file.exists else None
+        result.right_file = right_file if right_file.exists else None
+        result.invalidate()
+        self.status_arr[index] = _STATUS_CODES[result.display_status]
+    
     def edit_file(self, index: int, side: str = "both") -> bool:
         """Edit file(s) using external editor."""
         if not (0 <= index < len(self.results)):
@@ -203,21 +658,22 @@ class DirectoryComparer:
             return False
         
         # Get editor from environment, default to vim
-        editor = os.environ.get('EDITOR', 'vim')
+        editor = self.editor_command()
         
         try:
             # Open editor
             if len(files_to_edit) == 1:
-                subprocess.run([editor, files_to_edit[0]], check=True)
+                subprocess.run(editor + [files_to_edit[0]], check=True)
             else:
                 # Open both files in split mode if editor supports it
-                if 'vim' in editor or 'nvim' in editor:
-                    subprocess.run([editor, '-O'] + files_to_edit, check=True)
+                if 'vim' in editor[0]:
+                    subprocess.run(editor + ['-O'] + files_to_edit, check=True)
                 else:
                     # Open files sequentially
                     for file_path in files_to_edit:
-                        subprocess.run([editor, file_path], check=True)
+                        subprocess.run(editor + [file_path], check=True)
             
+            self._refresh_one(index)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
@@ -246,15 +702,18 @@ class DirectoryComparer:
             if shutil.which(tool_name):
                 try:
                     # Prepare command
-                    editor = os.environ.get('EDITOR', 'vim')
                     cmd = []
                     for arg in cmd_template:
-                        arg = arg.replace('{editor}', editor)
-                        arg = arg.replace('{left}', str(left_path))
-                        arg = arg.replace('{right}', str(right_path))
-                        cmd.append(arg)
+                        if arg == '{editor}':
+                            # EDITOR may carry its own arguments
+                            cmd.extend(self.editor_command())
+                        else:
+                            arg = arg.replace('{left}', str(left_path))
+                            arg = arg.replace('{right}', str(right_path))
+                            cmd.append(arg)
                     
                     subprocess.run(cmd, check=True)
+                    self._refresh_one(index)
                     return True
                 except (subprocess.CalledProcessError, FileNotFoundError):
                     continue
@@ -314,6 +773,52 @@ class DirectoryComparer:
 class CursesUI:
     """Curses-based user interface for the directory comparer."""
     
+    _help_lines = tuple("  " + line for line in (
+        "Directory Comparison Tool - Help",
+        "",
+        "Navigation:",
+        "  ↑/↓ or j/k    - Move selection up/down",
+        "  PgUp/PgDn     - Page up/down",
+        "  Home/End      - Go to first/last file",
+        "  n/p           - Jump to next/previous difference",
+        "",
+        "File Operations:",
+        "  F3 or <       - Copy selected file from right to left",
+        "  F4 or >       - Copy selected file from left to right",
+        "",
+        "Editing & Merging:",
+        "  e             - Edit both files (if they exist)",
+        "  E             - Edit left file only",
+        "  w             - Edit right file only",
+        "  m             - Merge files using external tool",
+        "  M             - Create manual merge file",
+        "",
+        "Other Commands:",
+        "  r             - Refresh directory comparison",
+        "  h or ?        - Show this help",
+        "  q or ESC      - Quit application",
+        "",
+        "File Status Symbols:",
+        "  >>>           - File only exists on left",
+        "  <<<           - File only exists on right",
+        "  !=            - Files have different sizes",
+        "  ~=            - Files have different modification times",
+        "  <>            - Files have different content",
+        "  ==            - Files are identical",
+        "",
+        "Special Indicators:",
+        "  [M]           - Files can be merged",
+        "",
+        "Notes:",
+        "- Set EDITOR environment variable for preferred editor",
+        "- Merge functionality requires text files",
+        "- External merge tools: vimdiff, meld, diff3, merge",
+        "",
+        "Press any key to continue..."
+    ))
+    # Lines carry their own indent since a newline returns to column 0
+    _help_blob = "\n".join(_help_lines)
+    
     def __init__(self, comparer: DirectoryComparer):
         self.comparer = comparer
         self.stdscr = None
@@ -323,6 +828,12 @@ class CursesUI:
         self.scroll_offset = 0
         self.status_message = ""
         self.copying = False
+        self._border_cache = {}  # Column widths -> prebuilt border lines
+        self.pad = None  # Off-screen window holding the visible file list rows
+        self._drawn_index = 0  # Selection shown in the pad
+        self._pad_offset = 0  # Scroll offset the pad's rows were rendered at
+        self._drawn_size = None  # Terminal size of the last full redraw
+        self.full_redraw = True  # Set when more than the selection changed
         
     def run(self, stdscr):
         """Main UI loop."""
@@ -342,11 +853,22 @@ class CursesUI:
         curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)    # Identical
         curses.init_pair(7, curses.COLOR_WHITE, curses.COLOR_RED)     # Error
         
+        navigation_keys = (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_PPAGE,
+                           curses.KEY_NPAGE, curses.KEY_HOME, curses.KEY_END,
+                           ord('n'), ord('p'))
+        
         while True:
             self._update_dimensions()
-            self._draw_screen()
+            if self.full_redraw or self.pad is None or self._drawn_size != (self.height, self.width):
+                self._draw_screen()
+            else:
+                self._update_file_list()
             
             key = stdscr.getch()
+            # Plain navigation only needs the pad scrolled; anything else
+            # may change files, layout or the whole screen
+            if key not in navigation_keys:
+                self.full_redraw = True
             if key == ord('q') or key == 27:  # ESC
                 break
             elif key == curses.KEY_UP:
@@ -361,6 +883,10 @@ class CursesUI:
                 self._move_selection(-len(self.comparer.results))
             elif key == curses.KEY_END:
                 self._move_selection(len(self.comparer.results))
+            elif key == ord('n'):  # Next difference
+                self._jump_to_difference(backward=False)
+            elif key == ord('p'):  # Previous difference
+                self._jump_to_difference(backward=True)
             elif key == curses.KEY_F4 or key == ord('>'):  # Copy left to right
                 self._copy_file_left_to_right()
             elif key == curses.KEY_F3 or key == ord('<'):  # Copy right to left
@@ -387,7 +913,7 @@ class CursesUI:
     
     def _draw_screen(self):
         """Draw the main screen."""
-        self.stdscr.clear()
+        self.stdscr.erase()
         
         # Draw header
         header = f" Directory Comparison: {self.comparer.left_dir.name} <-> {self.comparer.right_dir.name} "
@@ -396,20 +922,9 @@ class CursesUI:
         self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
         
         # Draw detailed column headers with clear sections
-        # Calculate proper column widths - allocate more space for filenames
-        status_col_width = 12
-        # Give more space to filename columns, especially for wider terminals
-        if self.width >= 120:
-            left_col_width = max(40, self.width // 3)
-        elif self.width >= 80:
-            left_col_width = max(35, self.width // 3)
-        else:
-            left_col_width = max(20, self.width // 3 - 1)
-        right_col_width = self.width - left_col_width - status_col_width - 4  # -4 for the 4 border characters
-        
-        headers_line1 = "┌" + "─" * left_col_width + "┬" + "─" * status_col_width + "┬" + "─" * right_col_width + "┐"
-        headers_line2 = f"│{'LEFT DIRECTORY':<{left_col_width}}│{'STATUS':<{status_col_width}}│{'RIGHT DIRECTORY':<{right_col_width}}│"
-        headers_line3 = "├" + "─" * left_col_width + "┼" + "─" * status_col_width + "┼" + "─" * right_col_width + "┤"
+        left_col_width, status_col_width, right_col_width = self._column_widths()
+        headers_line1, headers_line2, headers_line3, _ = self._border_lines(
+            left_col_width, status_col_width, right_col_width)
         
         try:
             self.stdscr.addstr(1, 0, headers_line1[:self.width])
@@ -428,14 +943,31 @@ class CursesUI:
         # Draw status and help
         self._draw_status()
         self._draw_help_line()
-    
-    def _draw_file_list(self):
-        """Draw the file comparison list."""
-        if not self.comparer.results:
-            self.stdscr.addstr(5, 2, "No files found or directories don't exist")
-            return
         
-        # Calculate column widths (same as in _draw_screen)
+        # Compose the screen and the visible part of the pad in one update
+        self.stdscr.noutrefresh()
+        self._show_file_list()
+        curses.doupdate()
+        self._drawn_size = (self.height, self.width)
+        self.full_redraw = False
+    
+    def _border_lines(self, left_col_width: int, status_col_width: int,
+                      right_col_width: int) -> Tuple[str, str, str, str]:
+        """Return the three header lines and the bottom line for a layout."""
+        key = (left_col_width, status_col_width, right_col_width)
+        lines = self._border_cache.get(key)
+        if lines is None:
+            lines = (
+                "┌" + "─" * left_col_width + "┬" + "─" * status_col_width + "┬" + "─" * right_col_width + "┐",
+                f"│{'LEFT DIRECTORY':<{left_col_width}}│{'STATUS':<{status_col_width}}│{'RIGHT DIRECTORY':<{right_col_width}}│",
+                "├" + "─" * left_col_width + "┼" + "─" * status_col_width + "┼" + "─" * right_col_width + "┤",
+                "└" + "─" * left_col_width + "┴" + "─" * status_col_width + "┴" + "─" * right_col_width + "┘",
+            )
+            self._border_cache[key] = lines
+        return lines
+    
+    def _column_widths(self) -> Tuple[int, int, int]:
+        """Calculate left, status and right column widths for the terminal."""
         status_col_width = 12
         # Give more space to filename columns, especially for wider terminals
         if self.width >= 120:
@@ -445,135 +977,207 @@ class CursesUI:
         else:
             left_col_width = max(20, self.width // 3 - 1)
         right_col_width = self.width - left_col_width - status_col_width - 4  # -4 for the 4 border characters
+        return left_col_width, status_col_width, right_col_width
+    
+    def _draw_file_list(self):
+        """Draw the file comparison list.
+        
+        Only the visible slice of results is rendered, into an off-screen
+        pad one screen tall; moving the selection within it redraws two
+        rows (see _update_file_list) and scrolling re-renders the slice.
+        """
+        if not self.comparer.results:
+            self.pad = None
+            self.stdscr.addstr(5, 2, "No files found or directories don't exist")
+            return
         
-        # Adjust scroll offset
+        # One pad row per visible line plus a spare row, which keeps a
+        # full-width bottom border from writing past the pad's last cell
+        self.pad = curses.newpad(self.list_height + 1, self.width)
+        self._adjust_scroll()
+        self._render_slice()
+        self._drawn_index = self.comparer.selected_index
+    
+    def _adjust_scroll(self):
+        """Move the scroll offset just enough to keep the selection visible."""
         if self.comparer.selected_index < self.scroll_offset:
             self.scroll_offset = self.comparer.selected_index
         elif self.comparer.selected_index >= self.scroll_offset + self.list_height:
             self.scroll_offset = max(0, self.comparer.selected_index - self.list_height + 1)
+    
+    def _render_slice(self):
+        """Render the rows visible at the current scroll offset into the pad."""
+        self.pad.erase()
+        self._pad_offset = self.scroll_offset
+        results = self.comparer.results
+        stop = min(self.scroll_offset + self.list_height, len(results))
+        for result_index in range(self.scroll_offset, stop):
+            self._draw_row(result_index)
         
-        # Calculate visible items (each file takes 1 row now)
-        visible_items = self.list_height
+        # Bottom border right below the last file, when it is on screen
+        border_row = len(results) - self.scroll_offset
+        if border_row < self.list_height:
+            left_col_width, status_col_width, right_col_width = self._column_widths()
+            try:
+                bottom_line = self._border_lines(left_col_width, status_col_width, right_col_width)[3]
+                self.pad.addstr(border_row, 0, bottom_line[:self.width])
+            except curses.error:
+                # Fallback to simple bottom line
+                self.pad.addstr(border_row, 0, "-" * self.width)
+    
+    def _draw_row(self, result_index: int):
+        """Draw one result into the file list pad, if it is in the rendered slice."""
+        pad_row = result_index - self._pad_offset
+        if not 0 <= pad_row < self.list_height:
+            return
         
-        for i in range(visible_items):
-            result_index = self.scroll_offset + i
-            if result_index >= len(self.comparer.results):
-                break
-                
-            result = self.comparer.results[result_index]
-            y_pos = 4 + i  # Start after headers
-            
-            if y_pos >= self.height - 2:
-                break
-            
-            # Determine colors based on status
-            color_pair = 0
-            if result.status == "ONLY_LEFT":
-                color_pair = 3
-            elif result.status == "ONLY_RIGHT":
-                color_pair = 4
-            elif result.status in ["DIFFERENT_SIZE", "DIFFERENT_TIME", "DIFFERENT_CONTENT"]:
-                color_pair = 5
-            elif result.status == "IDENTICAL":
-                color_pair = 6
-            
-            # Highlight selected item
-            attr = curses.color_pair(color_pair)
-            if result_index == self.comparer.selected_index:
-                attr |= curses.A_REVERSE
-            
-            # Format file information for left side
-            left_info = "─ MISSING ─"
-            if result.left_file and result.left_file.exists:
-                size_str = self._format_size(result.left_file.size)
-                time_str = datetime.fromtimestamp(result.left_file.mtime).strftime("%m/%d %H:%M")
-                left_info = f"{size_str} {time_str}"
-            
-            # Format file information for right side  
-            right_info = "─ MISSING ─"
-            if result.right_file and result.right_file.exists:
-                size_str = self._format_size(result.right_file.size)
-                time_str = datetime.fromtimestamp(result.right_file.mtime).strftime("%m/%d %H:%M")
-                right_info = f"{size_str} {time_str}"
-            
-            # Get status description
-            status_descriptions = {
-                "ONLY_RIGHT": "<<<",
-                "ONLY_LEFT": ">>>", 
-                "DIFFERENT_SIZE": "SIZE",
-                "DIFFERENT_TIME": "TIME",
-                "DIFFERENT_CONTENT": "DIFF",
-                "IDENTICAL": "SAME"
-            }
-            status_text = status_descriptions.get(result.status, "????")
-            
-            # Add merge indicator
-            if result.can_merge:
-                status_text += "[M]"
-            
-            # Use the same column widths as headers
-            left_width = left_col_width
-            status_width = status_col_width 
-            right_width = right_col_width
-            
-            # Create the complete line with filename and status info
-            filename = result.relative_path
-            filename_space = left_width - 18  # Reserve space for size/time info
-            
-            if len(filename) > filename_space:
-                # Smart truncation: try to show the most relevant part
-                if "/" in filename:
-                    # If it's a path, try to show the filename and as much path as possible
-                    parts = filename.split("/")
-                    base_filename = parts[-1]
-                    if len(base_filename) + 4 <= filename_space:  # +4 for ".../"
-                        # Show as much directory path as possible with the filename
-                        remaining_space = filename_space - len(base_filename) - 4
-                        path_part = "/".join(parts[:-1])
-                        if len(path_part) > remaining_space:
-                            path_part = path_part[-remaining_space:]
-                            # Try to break at a directory boundary if possible
-                            if "/" in path_part[1:]:
-                                path_part = path_part[path_part.find("/", 1):]
-                        filename = f".../{path_part}/{base_filename}"
-                    else:
-                        # Just truncate from the beginning
-                        filename = "..." + filename[-(filename_space - 3):]
+        result = self.comparer.results[result_index]
+        # Rows off screen keep a pending content check pending
+        status = result.display_status
+        
+        # Determine colors based on status
+        color_pair = 0
+        if status == "ONLY_LEFT":
+            color_pair = 3
+        elif status == "ONLY_RIGHT":
+            color_pair = 4
+        elif status in ["DIFFERENT_SIZE", "DIFFERENT_TIME", "DIFFERENT_CONTENT"]:
+            color_pair = 5
+        elif status == "IDENTICAL":
+            color_pair = 6
+        
+        # Highlight selected item
+        attr = curses.color_pair(color_pair)
+        if result_index == self.comparer.selected_index:
+            attr |= curses.A_REVERSE
+        
+        # Reuse the formatted line unless the status or layout changed
+        left_col_width, status_col_width, right_col_width = self._column_widths()
+        key = (status, left_col_width, status_col_width, right_col_width)
+        if result._rendered_key != key:
+            result._rendered = self._format_row(result, left_col_width, status_col_width, right_col_width)
+            result._rendered_key = key
+        line = result._rendered
+        
+        # Draw the line
+        self.pad.attron(attr)
+        try:
+            self.pad.addstr(pad_row, 0, line[:self.width])
+        except curses.error:
+            # Handle edge cases where line is too long
+            self.pad.addstr(pad_row, 0, line[:self.width-1])
+        self.pad.attroff(attr)
+    
+    def _show_file_list(self):
+        """Scroll to the selection and copy the pad to the screen."""
+        if self.pad is None:
+            return
+        
+        self._adjust_scroll()
+        if self.scroll_offset != self._pad_offset:
+            self._render_slice()
+        self._resolve_visible()
+        
+        # Rows 4 .. height-3 hold the list (after headers, before status)
+        last_row = min(4 + self.list_height - 1, self.height - 3)
+        if last_row >= 4:
+            self.pad.noutrefresh(0, 0, 4, 0, last_row, self.width - 1)
+    
+    def _resolve_visible(self):
+        """Run pending content checks for the rows on screen and redraw them."""
+        results = self.comparer.results
+        start = self.scroll_offset
+        stop = min(start + self.list_height, len(results))
+        pending = [i for i in range(start, stop) if results[i].display_status == "PENDING"]
+        if pending:
+            self.comparer.ensure_compared(start, stop)
+            for result_index in pending:
+                self._draw_row(result_index)
+    
+    def _update_file_list(self):
+        """Redraw only what a selection move changes: two rows and the status bar."""
+        old_index = self._drawn_index
+        new_index = self.comparer.selected_index
+        if old_index != new_index:
+            if 0 <= old_index < len(self.comparer.results):
+                self._draw_row(old_index)
+            self._draw_row(new_index)
+            self._drawn_index = new_index
+        
+        status_y = self.height - 2
+        self.stdscr.move(status_y, 0)
+        self.stdscr.clrtoeol()
+        self._draw_status()
+        self.stdscr.noutrefresh()
+        self._show_file_list()
+        curses.doupdate()
+    
+    def _format_row(self, result: ComparisonResult, left_col_width: int,
+                    status_col_width: int, right_col_width: int) -> str:
+        """Format one comparison result as a bordered file list line."""
+        # Format file information for left side
+        left_info = "─ MISSING ─"
+        if result.left_file and result.left_file.exists:
+            left_info = f"{result.left_file.size_str} {result.left_file.mtime_str}"
+        
+        # Format file information for right side  
+        right_info = "─ MISSING ─"
+        if result.right_file and result.right_file.exists:
+            right_info = f"{result.right_file.size_str} {result.right_file.mtime_str}"
+        
+        # Get status description
+        status = result.display_status
+        status_text = _STATUS_DESCRIPTIONS.get(status, "????")
+        
+        # Add merge indicator (can_merge needs the final status)
+        if status != "PENDING" and result.can_merge:
+            status_text += "[M]"
+        
+        # Use the same column widths as headers
+        left_width = left_col_width
+        status_width = status_col_width 
+        right_width = right_col_width
+        
+        # Create the complete line with filename and status info
+        filename = result.relative_path
+        filename_space = left_width - 18  # Reserve space for size/time info
+        
+        if len(filename) > filename_space:
+            # Smart truncation: try to show the most relevant part
+            if "/" in filename:
+                # If it's a path, try to show the filename and as much path as possible
+                parts = filename.split("/")
+                base_filename = parts[-1]
+                if len(base_filename) + 4 <= filename_space:  # +4 for ".../"
+                    # Show as much directory path as possible with the filename
+                    remaining_space = filename_space - len(base_filename) - 4
+                    path_part = "/".join(parts[:-1])
+                    if len(path_part) > remaining_space:
+                        path_part = path_part[-remaining_space:]
+                        # Try to break at a directory boundary if possible
+                        if "/" in path_part[1:]:
+                            path_part = path_part[path_part.find("/", 1):]
+                    filename = f".../{path_part}/{base_filename}"
                 else:
-                    # Simple truncation for non-path filenames
+                    # Just truncate from the beginning
                     filename = "..." + filename[-(filename_space - 3):]
-            
-            left_part = f"{filename:<{left_width-18}}{left_info:>17}"
-            # Ensure exact column width - pad or truncate as needed
-            left_part = f"{left_part:<{left_width}}"[:left_width]
-            status_part = f"{status_text:^{status_width}}"
-            right_part = f"{right_info:<{right_width}}"[:right_width]
-            
-            # Construct the complete line with borders
-            try:
-                line = f"│{left_part}│{status_part}│{right_part}│"
-            except:
-                line = f"|{left_part}|{status_part}|{right_part}|"
-            
-            # Draw the line
-            self.stdscr.attron(attr)
-            try:
-                self.stdscr.addstr(y_pos, 0, line[:self.width])
-            except curses.error:
-                # Handle edge cases where line is too long
-                self.stdscr.addstr(y_pos, 0, line[:self.width-1])
-            self.stdscr.attroff(attr)
-        
-        # Draw bottom border if we have files
-        if self.comparer.results:
-            bottom_y = 4 + min(visible_items, len(self.comparer.results) - self.scroll_offset)
-            if bottom_y < self.height - 2:
-                try:
-                    bottom_line = "└" + "─" * left_col_width + "┴" + "─" * status_col_width + "┴" + "─" * right_col_width + "┘"
-                    self.stdscr.addstr(bottom_y, 0, bottom_line[:self.width])
-                except curses.error:
-                    # Fallback to simple bottom line
-                    self.stdscr.addstr(bottom_y, 0, "-" * self.width)
+            else:
+                # Simple truncation for non-path filenames
+                filename = "..." + filename[-(filename_space - 3):]
+        
+        # str.ljust/rjust/center skip the format-spec parsing that nested
+        # f-string widths ({x:<{w}}) redo on every call
+        left_part = filename.ljust(left_width - 18) + left_info.rjust(17)
+        # Ensure exact column width - pad or truncate as needed
+        left_part = left_part.ljust(left_width)[:left_width]
+        status_part = status_text.center(status_width)
+        right_part = right_info.ljust(right_width)[:right_width]
+        
+        # Construct the complete line with borders
+        try:
+            return f"│{left_part}│{status_part}│{right_part}│"
+        except:
+            return f"|{left_part}|{status_part}|{right_part}|"
     
     def _draw_status(self):
         """Draw status bar."""
@@ -604,6 +1208,18 @@ class CursesUI:
         self.comparer.selected_index = max(0, min(len(self.comparer.results) - 1, new_index))
         self.status_message = ""
     
+    def _jump_to_difference(self, backward: bool):
+        """Select the nearest row, below or above, whose files differ."""
+        if not self.comparer.results:
+            return
+        
+        index = self.comparer.find_difference(self.comparer.selected_index, backward)
+        if index < 0:
+            self.status_message = "No more differences"
+        else:
+            self.comparer.selected_index = index
+            self.status_message = ""
+    
     def _copy_file_left_to_right(self):
         """Copy selected file from left to right."""
         if self.copying or not self.comparer.results:
@@ -617,6 +1233,7 @@ class CursesUI:
                 self.status_message = "File copied left → right"
             else:
                 self.status_message = "Failed to copy file"
+            self.full_redraw = True  # The copied row needs re-rendering
         
         threading.Thread(target=copy_thread, daemon=True).start()
     
@@ -633,6 +1250,7 @@ class CursesUI:
                 self.status_message = "File copied right → left"
             else:
                 self.status_message = "Failed to copy file"
+            self.full_redraw = True  # The copied row needs re-rendering
         
         threading.Thread(target=copy_thread, daemon=True).start()
     
@@ -664,8 +1282,7 @@ class CursesUI:
             
             success = self.comparer.edit_file(self.comparer.selected_index, side)
             if success:
-                # Refresh the file info after editing
-                self.comparer.scan_directories()
+                # edit_file() has already refreshed the edited row
                 if side == "both":
                     self.status_message = "Files edited successfully"
                 else:
@@ -697,8 +1314,7 @@ class CursesUI:
             
             success = self.comparer.merge_files(self.comparer.selected_index)
             if success:
-                # Refresh the file info after merging
-                self.comparer.scan_directories()
+                # merge_files() has already refreshed the merged row
                 self.status_message = "Files merged successfully"
             else:
                 self.status_message = "Merge failed or was cancelled"
@@ -724,12 +1340,12 @@ class CursesUI:
         merge_file = self.comparer.create_merge_file(self.comparer.selected_index)
         if merge_file:
             # Edit the merge file
-            editor = os.environ.get('EDITOR', 'vim')
+            editor = self.comparer.editor_command()
             try:
                 self.status_message = "Opening merge file in editor..."
                 # Suspend curses mode temporarily
                 curses.endwin()
-                subprocess.run([editor, merge_file], check=True)
+                subprocess.run(editor + [merge_file], check=True)
                 self.status_message = f"Manual merge completed: {merge_file}"
             except (subprocess.CalledProcessError, FileNotFoundError):
                 self.status_message = "Failed to open merge file in editor"
@@ -750,54 +1366,13 @@ class CursesUI:
     
     def _show_help(self):
         """Show help dialog."""
-        help_text = [
-            "Directory Comparison Tool - Help",
-            "",
-            "Navigation:",
-            "  ↑/↓ or j/k    - Move selection up/down",
-            "  PgUp/PgDn     - Page up/down",
-            "  Home/End      - Go to first/last file",
-            "",
-            "File Operations:",
-            "  F3 or <       - Copy selected file from right to left",
-            "  F4 or >       - Copy selected file from left to right",
-            "",
-            "Editing & Merging:",
-            "  e             - Edit both files (if they exist)",
-            "  E             - Edit left file only",
-            "  w             - Edit right file only",
-            "  m             - Merge files using external tool",
-            "  M             - Create manual merge file",
-            "",
-            "Other Commands:",
-            "  r             - Refresh directory comparison",
-            "  h or ?        - Show this help",
-            "  q or ESC      - Quit application",
-            "",
-            "File Status Symbols:",
-            "  >>>           - File only exists on left",
-            "  <<<           - File only exists on right",
-            "  !=            - Files have different sizes",
-            "  ~=            - Files have different modification times",
-            "  <>            - Files have different content",
-            "  ==            - Files are identical",
-            "",
-            "Special Indicators:",
-            "  [M]           - Files can be merged",
-            "",
-            "Notes:",
-            "- Set EDITOR environment variable for preferred editor",
-            "- Merge functionality requires text files",
-            "- External merge tools: vimdiff, meld, diff3, merge",
-            "",
-            "Press any key to continue..."
-        ]
-        
-        # Clear screen and show help
-        self.stdscr.clear()
-        for i, line in enumerate(help_text):
-            if i < self.height - 1:
-                self.stdscr.addstr(i, 2, line)
+        # Clear screen and show help in one addstr; clip only when the
+        # terminal is too short for the whole block
+        self.stdscr.erase()
+        if len(self._help_lines) < self.height:
+            self.stdscr.addstr(0, 0, self._help_blob)
+        else:
+            self.stdscr.addstr(0, 0, "\n".join(self._help_lines[:self.height - 1]))
         
         self.stdscr.refresh()
         self.stdscr.getch()  # Wait for keypress
@@ -805,11 +1380,7 @@ class CursesUI:
     @staticmethod
     def _format_size(size: int) -> str:
         """Format file size in human readable format."""
-        for unit in ['B', 'K', 'M', 'G', 'T']:
-            if size < 1024:
-                return f"{size:3.0f}{unit}"
-            size /= 1024
-        return f"{size:.1f}P"
+        return _format_size(size)
 
 
 def main():
@@ -818,32 +1389,24 @@ def main():
     parser.add_argument("left_dir", help="Left directory to compare")
     parser.add_argument("right_dir", help="Right directory to compare")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("-c", "--checksum", action="store_true",
+                        help="Compare content of files with matching size and time instead of assuming they are identical")
     
     args = parser.parse_args()
     
-    # Validate directories
-    left_path = Path(args.left_dir)
-    right_path = Path(args.right_dir)
-    
-    if not left_path.exists():
-        print(f"Error: Left directory '{args.left_dir}' does not exist", file=sys.stderr)
-        sys.exit(1)
-    
-    if not right_path.exists():
-        print(f"Error: Right directory '{args.right_dir}' does not exist", file=sys.stderr)
-        sys.exit(1)
-    
-    if not left_path.is_dir():
-        print(f"Error: '{args.left_dir}' is not a directory", file=sys.stderr)
-        sys.exit(1)
-    
-    if not right_path.is_dir():
-        print(f"Error: '{args.right_dir}' is not a directory", file=sys.stderr)
-        sys.exit(1)
+    # Validate directories: one stat per argument; exists() is only
+    # consulted on the error path to pick the message
+    for label, directory in (("Left", args.left_dir), ("Right", args.right_dir)):
+        if not os.path.isdir(directory):
+            if not os.path.exists(directory):
+                print(f"Error: {label} directory '{directory}' does not exist", file=sys.stderr)
+            else:
+                print(f"Error: '{directory}' is not a directory", file=sys.stderr)
+            sys.exit(1)
     
     # Create comparer and scan directories
     print("Scanning directories...")
-    comparer = DirectoryComparer(args.left_dir, args.right_dir)
+    comparer = DirectoryComparer(args.left_dir, args.right_dir, hash_equal_sizes=args.checksum)
     comparer.scan_directories()
     
     if args.verbose:
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script for the default size/time comparison and --checksum mode,
+including the deferred (PENDING) content checks.
+Works on throwaway temporary directories, never on t1/t2.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+import dircomp
+from dircomp import ComparisonResult, DirectoryComparer
+
+
+def make_tree(base, files, mtime):
+    """Create a directory under base holding {name: bytes} files stamped with mtime."""
+    os.makedirs(base)
+    for name, data in files.items():
+        path = os.path.join(base, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        os.utime(path, (mtime, mtime))
+
+
+def make_pair(tmp):
+    """Two trees whose files match in size and mtime; only one pair matches in content."""
+    left = os.path.join(tmp, "L")
+    right = os.path.join(tmp, "R")
+    mtime = 1700000000
+    make_tree(left, {"changed.txt": b"version 1\n", "same.txt": b"same text\n"}, mtime)
+    make_tree(right, {"changed.txt": b"version 2\n", "same.txt": b"same text\n"}, mtime)
+    return left, right
+
+
+def statuses(comparer):
+    comparer.scan_directories()
+    return {result.relative_path: result.status for result in comparer.results}
+
+
+def test_default_trusts_metadata(tmp):
+    """Without --checksum, equal size and mtime count as identical."""
+    left, right = make_pair(os.path.join(tmp, "default"))
+    found = statuses(DirectoryComparer(left, right))
+    print(f"Default mode: {found}")
+    return found == {"changed.txt": "IDENTICAL", "same.txt": "IDENTICAL"}
+
+
+def test_checksum_reads_content(tmp):
+    """With --checksum, equal size and mtime are confirmed byte by byte."""
+    left, right = make_pair(os.path.join(tmp, "checksum"))
+    found = statuses(DirectoryComparer(left, right, hash_equal_sizes=True))
+    print(f"Checksum mode: {found}")
+    return found == {"changed.txt": "DIFFERENT_CONTENT", "same.txt": "IDENTICAL"}
+
+
+def test_no_per_row_flag(tmp):
+    """The checksum flag lives on the comparer, not on every result."""
+    left, right = make_pair(os.path.join(tmp, "slots"))
+    ok = True
+    for hash_equal_sizes in (False, True):
+        comparer = DirectoryComparer(left, right, hash_equal_sizes=hash_equal_sizes)
+        comparer.scan_directories()
+        ok &= not hasattr(comparer.results[0], '__dict__')
+    ok &= 'hash_equal_sizes' not in ComparisonResult.__slots__
+    print(f"Results carry no per-row flag: {ok}")
+    return ok
+
+
+def make_many(tmp, count):
+    """Trees with count same-size, same-mtime pairs; every third differs in content."""
+    left = os.path.join(tmp, "L")
+    right = os.path.join(tmp, "R")
+    mtime = 1700000000
+    names = [f"file{i:03d}.txt" for i in range(count)]
+    make_tree(left, {name: b"shared %03d\n" % i for i, name in enumerate(names)}, mtime)
+    make_tree(right, {name: (b"SHARED %03d\n" if i % 3 == 0 else b"shared %03d\n") % i
+                      for i, name in enumerate(names)}, mtime)
+    expected = ["DIFFERENT_CONTENT" if i % 3 == 0 else "IDENTICAL" for i in range(count)]
+    return left, right, expected
+
+
+def test_pending_until_compared(tmp):
+    """Checksum rows stay PENDING until .status or ensure_compared resolves them."""
+    left, right, expected = make_many(os.path.join(tmp, "pending"), 6)
+    comparer = DirectoryComparer(left, right, hash_equal_sizes=True)
+    comparer.scan_directories()
+    results = comparer.results
+    ok = all(result.display_status == "PENDING" for result in results)
+    ok &= bytes(comparer.status_arr) == b"?" * len(results)
+    print(f"All rows pending after the scan: {ok}")
+
+    # Reading .status resolves just that row
+    first = results[0].status
+    still_pending = [result.display_status for result in results[1:]]
+    print(f"Row 0 after .status: {first}, others pending: {set(still_pending) == {'PENDING'}}")
+    ok &= first == expected[0] and results[0].display_status == first
+    ok &= set(still_pending) == {"PENDING"}
+
+    # ensure_compared resolves a range and updates status_arr with it
+    comparer.ensure_compared(1, 3)
+    shown = [result.display_status for result in results]
+    print(f"After ensure_compared(1, 3): {shown}")
+    ok &= shown[:3] == expected[:3] and set(shown[3:]) == {"PENDING"}
+    ok &= bytes(comparer.status_arr[1:]) == bytes(dircomp._STATUS_CODES[status] for status in shown[1:])
+
+    comparer.ensure_compared(0, len(results))
+    shown = [result.display_status for result in results]
+    ok &= shown == expected
+    ok &= bytes(comparer.status_arr) == bytes(dircomp._STATUS_CODES[status] for status in expected)
+    print(f"After ensure_compared over all rows: {shown == expected}")
+    return ok
+
+
+def test_parallel_compare(tmp):
+    """A batch of at least PARALLEL_COMPARE_MIN pending rows goes through the pool."""
+    ok = True
+    for count, pooled in ((dircomp.PARALLEL_COMPARE_MIN - 1, False),
+                          (dircomp.PARALLEL_COMPARE_MIN + 8, True)):
+        left, right, expected = make_many(os.path.join(tmp, f"pool{count}"), count)
+        comparer = DirectoryComparer(left, right, hash_equal_sizes=True)
+        comparer.scan_directories()
+
+        pools = []
+        saved = dircomp.ThreadPoolExecutor
+
+        class RecordingExecutor(saved):
+            def __init__(self, *args, **kwargs):
+                pools.append(self)
+                super().__init__(*args, **kwargs)
+
+        dircomp.ThreadPoolExecutor = RecordingExecutor
+        try:
+            comparer.ensure_compared(0, len(comparer.results))
+        finally:
+            dircomp.ThreadPoolExecutor = saved
+        shown = [result.display_status for result in comparer.results]
+        print(f"{count} pending rows: pool used {bool(pools)}, statuses correct {shown == expected}")
+        ok &= bool(pools) == pooled and shown == expected
+    return ok
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp()
+    try:
+        results = [test_default_trusts_metadata(tmp), test_checksum_reads_content(tmp),
+                   test_no_per_row_flag(tmp), test_pending_until_compared(tmp),
+                   test_parallel_compare(tmp)]
+    finally:
+        shutil.rmtree(tmp)
+
+    if all(results):
+        print("\nAll checksum tests passed!")
+    else:
+        print("\nChecksum tests failed!")
+        sys.exit(1)
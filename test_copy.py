@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for file copying between the compared directories.
+Works on throwaway temporary directories, never on t1/t2.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+import dircomp
+from dircomp import DirectoryComparer
+
+
+def make_tree(base, files):
+    """Create a directory under base holding the given {name: bytes} files."""
+    os.makedirs(base)
+    for name, data in files.items():
+        with open(os.path.join(base, name), 'wb') as f:
+            f.write(data)
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_hardlinked_copy(tmp):
+    """Copying onto a hardlink of the source must fail and keep the data."""
+    left = os.path.join(tmp, "HL")
+    right = os.path.join(tmp, "HR")
+    make_tree(left, {"a.txt": b"precious\n"})
+    os.makedirs(right)
+    os.link(os.path.join(left, "a.txt"), os.path.join(right, "a.txt"))
+
+    comparer = DirectoryComparer(left, right)
+    comparer.scan_directories()
+    success = comparer.copy_file_left_to_right(0)
+    data = read(os.path.join(left, "a.txt"))
+    print(f"Hardlinked copy result: {'Success' if success else 'Failed'}, content: {data!r}")
+    return not success and data == b"precious\n"
+
+
+def test_normal_copy(tmp):
+    """Copies land on the other side and update the copied row."""
+    left = os.path.join(tmp, "L")
+    right = os.path.join(tmp, "R")
+    make_tree(left, {"new.txt": b"left only\n", "both.txt": b"left version\n", "empty.txt": b""})
+    make_tree(right, {"both.txt": b"right version, longer\n"})
+
+    comparer = DirectoryComparer(left, right)
+    comparer.scan_directories()
+    paths = [result.relative_path for result in comparer.results]
+    ok = True
+
+    for name in ("new.txt", "empty.txt"):
+        i = paths.index(name)
+        success = comparer.copy_file_left_to_right(i)
+        status = comparer.results[i].status
+        print(f"Copy {name} left -> right: {'Success' if success else 'Failed'}, status {status}")
+        ok &= success and status == "IDENTICAL"
+        ok &= read(os.path.join(right, name)) == read(os.path.join(left, name))
+
+    i = paths.index("both.txt")
+    success = comparer.copy_file_right_to_left(i)
+    status = comparer.results[i].status
+    print(f"Copy both.txt right -> left: {'Success' if success else 'Failed'}, status {status}")
+    ok &= success and status == "IDENTICAL"
+    ok &= read(os.path.join(left, "both.txt")) == b"right version, longer\n"
+
+    # The updated rows must agree with a full rescan
+    refreshed = [(r.relative_path, r.status) for r in comparer.results]
+    comparer.scan_directories()
+    rescanned = [(r.relative_path, r.status) for r in comparer.results]
+    print(f"Updated rows match a rescan: {refreshed == rescanned}")
+    return ok and refreshed == rescanned
+
+
+def test_empty_kernel_copy(tmp):
+    """A kernel copy that moves no bytes falls back to another copy."""
+    src = os.path.join(tmp, "src.bin")
+    dst = os.path.join(tmp, "dst.bin")
+    with open(src, 'wb') as f:
+        f.write(b"x" * 100000)
+
+    # Report EOF straight away, as some filesystems do
+    saved = getattr(os, 'copy_file_range', None)
+    os.copy_file_range = lambda infd, outfd, count, *args: 0
+    try:
+        dircomp._fast_copy(src, dst)
+    finally:
+        if saved is None:
+            del os.copy_file_range
+        else:
+            os.copy_file_range = saved
+    same = read(src) == read(dst)
+    print(f"Copy after a zero-byte kernel copy matches: {same}")
+    return same
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp()
+    try:
+        results = [test_hardlinked_copy(tmp), test_normal_copy(tmp), test_empty_kernel_copy(tmp)]
+    finally:
+        shutil.rmtree(tmp)
+
+    if all(results):
+        print("\nAll copy tests passed!")
+    else:
+        print("\nCopy tests failed!")
+        sys.exit(1)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for parsing the EDITOR environment variable.
+Never launches an editor.
+"""
+
+import os
+import sys
+
+from dircomp import DirectoryComparer
+
+
+def editor_argv(comparer, value):
+    """Return the argv editor_command() builds for EDITOR=value (None unsets it)."""
+    if value is None:
+        os.environ.pop('EDITOR', None)
+    else:
+        os.environ['EDITOR'] = value
+    return comparer.editor_command()
+
+
+def test_editor_parsing():
+    """Arguments are split shell-style; malformed or blank values fall back to vim."""
+    comparer = DirectoryComparer('t1', 't2')
+    cases = [
+        ("code --wait", ['code', '--wait']),
+        ("'/opt/My Editor/bin/edit' -n", ['/opt/My Editor/bin/edit', '-n']),
+        ('"vim', ['vim']),  # Unbalanced quote
+        ("", ['vim']),
+        ("   ", ['vim']),
+        (None, ['vim']),
+        ("nano", ['nano']),
+    ]
+    ok = True
+    for value, expected in cases:
+        argv = editor_argv(comparer, value)
+        print(f"EDITOR={value!r}: {argv}")
+        ok &= argv == expected
+    return ok
+
+
+def test_editor_cache():
+    """The argv is reused while EDITOR is unchanged and rebuilt when it changes."""
+    comparer = DirectoryComparer('t1', 't2')
+    first = editor_argv(comparer, "code --wait")
+    again = editor_argv(comparer, "code --wait")
+    changed = editor_argv(comparer, "emacs -nw")
+    print(f"Cached argv reused: {first is again}, rebuilt on change: {changed}")
+    return first is again and changed == ['emacs', '-nw']
+
+
+if __name__ == "__main__":
+    saved = os.environ.get('EDITOR')
+    try:
+        results = [test_editor_parsing(), test_editor_cache()]
+    finally:
+        if saved is None:
+            os.environ.pop('EDITOR', None)
+        else:
+            os.environ['EDITOR'] = saved
+
+    if all(results):
+        print("\nAll editor tests passed!")
+    else:
+        print("\nEditor tests failed!")
+        sys.exit(1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for jumping between differences (n/p) and the status_arr
+mirror of the result statuses.
+Works on throwaway temporary directories, never on t1/t2.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+from dircomp import DirectoryComparer, _STATUS_CODES
+
+MTIME = 1700000000
+
+# name: (left content, right content); None leaves that side missing
+FILES = {
+    "a_same.txt": (b"same\n", b"same\n"),
+    "b_same.txt": (b"also same\n", b"also same\n"),
+    "c_size.txt": (b"short\n", b"much longer\n"),
+    "d_same.txt": (b"same again\n", b"same again\n"),
+    "e_left.txt": (b"left only\n", None),
+    "f_content.txt": (b"version 1\n", b"version 2\n"),
+    "g_same.txt": (b"last\n", b"last\n"),
+}
+
+
+def make_trees(tmp):
+    """Create the left and right trees from FILES, every file stamped with MTIME."""
+    left = os.path.join(tmp, "L")
+    right = os.path.join(tmp, "R")
+    os.makedirs(left)
+    os.makedirs(right)
+    for name, contents in FILES.items():
+        for base, data in zip((left, right), contents):
+            if data is None:
+                continue
+            path = os.path.join(base, name)
+            with open(path, 'wb') as f:
+                f.write(data)
+            os.utime(path, (MTIME, MTIME))
+    return left, right
+
+
+def codes_match(comparer):
+    """True when status_arr holds the code of every row's display_status."""
+    expected = bytes(_STATUS_CODES[result.display_status] for result in comparer.results)
+    return bytes(comparer.status_arr) == expected
+
+
+def walk(comparer, start, backward):
+    """Follow find_difference from start until it returns -1."""
+    hits = []
+    index = comparer.find_difference(start, backward)
+    while index >= 0:
+        hits.append(index)
+        index = comparer.find_difference(index, backward)
+    return hits
+
+
+def test_find_difference(tmp):
+    """n/p stop on differing rows only, in both directions, and -1 past either end."""
+    left, right = make_trees(os.path.join(tmp, "find"))
+    ok = True
+    for hash_equal_sizes in (False, True):
+        comparer = DirectoryComparer(left, right, hash_equal_sizes=hash_equal_sizes)
+        comparer.scan_directories()
+        last = len(comparer.results) - 1
+        forward = walk(comparer, -1, False)
+        backward = walk(comparer, last + 1, True)
+        ends = (comparer.find_difference(last), comparer.find_difference(0, backward=True))
+        print(f"checksum={hash_equal_sizes}: forward {forward}, backward {backward}, ends {ends}")
+        # Without --checksum f_content.txt matches on size and time
+        differing = [2, 4, 5] if hash_equal_sizes else [2, 4]
+        ok &= forward == differing and backward == differing[::-1] and ends == (-1, -1)
+        ok &= codes_match(comparer)
+    return ok
+
+
+def test_pending_identical_skipped(tmp):
+    """A pending row that turns out identical is passed over, and resolved on the way."""
+    left, right = make_trees(os.path.join(tmp, "skip"))
+    comparer = DirectoryComparer(left, right, hash_equal_sizes=True)
+    comparer.scan_directories()
+    before = bytes(comparer.status_arr)
+    index = comparer.find_difference(-1)
+    after = bytes(comparer.status_arr)
+    print(f"status_arr {before!r} -> {after!r}, first difference at {index}")
+    return (before[:2] == b"??" and after[:2] == b"==" and index == 2
+            and comparer.results[0].display_status == "IDENTICAL")
+
+
+def test_status_arr_follows_updates(tmp):
+    """status_arr agrees with display_status after ensure_compared and _refresh_one."""
+    left, right = make_trees(os.path.join(tmp, "refresh"))
+    comparer = DirectoryComparer(left, right, hash_equal_sizes=True)
+    comparer.scan_directories()
+    ok = codes_match(comparer)
+
+    comparer.ensure_compared(0, len(comparer.results))
+    print(f"After ensure_compared: {bytes(comparer.status_arr)!r}, matches {codes_match(comparer)}")
+    ok &= codes_match(comparer) and b"?" not in comparer.status_arr
+
+    # Edit g_same.txt on the right, and copy e_left.txt across, which
+    # refreshes its row through _refresh_one
+    paths = [result.relative_path for result in comparer.results]
+    with open(os.path.join(right, "g_same.txt"), 'wb') as f:
+        f.write(b"last, edited\n")
+    comparer._refresh_one(paths.index("g_same.txt"))
+    ok &= comparer.copy_file_left_to_right(paths.index("e_left.txt"))
+    print(f"After _refresh_one: {bytes(comparer.status_arr)!r}, matches {codes_match(comparer)}")
+    ok &= codes_match(comparer)
+    ok &= comparer.results[paths.index("g_same.txt")].display_status == "DIFFERENT_SIZE"
+    # The copy matches on size and time, so it waits for a content check
+    ok &= comparer.results[paths.index("e_left.txt")].display_status == "PENDING"
+    comparer.ensure_compared(paths.index("e_left.txt"))
+    ok &= comparer.results[paths.index("e_left.txt")].display_status == "IDENTICAL"
+    ok &= codes_match(comparer)
+
+    # A refreshed row that matches on size and time is pending again
+    with open(os.path.join(right, "g_same.txt"), 'wb') as f:
+        f.write(b"LAST\n")
+    os.utime(os.path.join(right, "g_same.txt"), (MTIME, MTIME))
+    comparer._refresh_one(paths.index("g_same.txt"))
+    pending = comparer.status_arr[paths.index("g_same.txt")] == _STATUS_CODES["PENDING"]
+    found = comparer.find_difference(paths.index("f_content.txt"))
+    print(f"Refreshed row pending: {pending}, next difference after f_content.txt: {found}")
+    ok &= pending and found == paths.index("g_same.txt") and codes_match(comparer)
+    return ok
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp()
+    try:
+        results = [test_find_difference(tmp), test_pending_identical_skipped(tmp),
+                   test_status_arr_follows_updates(tmp)]
+    finally:
+        shutil.rmtree(tmp)
+
+    if all(results):
+        print("\nAll navigation tests passed!")
+    else:
+        print("\nNavigation tests failed!")
+        sys.exit(1)